@@ -68,15 +68,18 @@ def handle_request(
     except Exception as e:
         return {
             'status': 'error',
-            'error': f"Processing failed: {str(e)}"
+            'error': f"Processing failed: {e}"
         }
     
     # STEP 4: LOGIC - If multi-node, check consensus
     if enable_multi_node:
-        # Simulate multiple node responses (in real system, these come from actual nodes)
-        responses = simulate_multi_node_responses(action, data, result)
-        
-        consensus, logic_msg = enforce_logic(responses)
+        # Simulate multiple node results (in real system, these come from
+        # actual nodes). The simulated responses carry nothing but the
+        # result, so pass the flat results array and skip per-response
+        # dict unpacking in the enforcer.
+        node_results = simulate_multi_node_results(action, data, result)
+
+        consensus, logic_msg = enforce_logic(results=node_results)
         if not consensus:
             return {
                 'status': 'no_consensus',
@@ -119,29 +122,25 @@ def process_action(action: str, data: Any) -> Any:
         raise ValueError(f"Unknown action: {action}")
 
 
-def simulate_multi_node_responses(action: str, data: Any, local_result: Any) -> list:
+def simulate_multi_node_results(action: str, data: Any, local_result: Any) -> list:
     """
-    Simulate responses from multiple nodes for consensus testing.
-    
+    Simulate result values from multiple nodes for consensus testing.
+
     In a real system, you would:
     1. Send the request to multiple nodes
-    2. Collect their responses
-    3. Pass them to enforce_logic()
-    
+    2. Collect their result values
+    3. Pass them to enforce_logic(results=...)
+
     Args:
         action: Action performed
         data: Input data
         local_result: Result from local processing
-    
+
     Returns:
-        List of response dictionaries
+        List of result values, one per node
     """
     # Simulate 3 nodes agreeing with local result
-    return [
-        {'result': local_result, 'node': 'node-alpha'},
-        {'result': local_result, 'node': 'node-beta'},
-        {'result': local_result, 'node': 'node-gamma'}
-    ]
+    return [local_result, local_result, local_result]
 
 
 def main():
@@ -7,11 +7,143 @@ All checks are fail-closed (deny by default on any error).
 This module provides deterministic, stateless enforcement with no external dependencies.
 """
 
+import concurrent.futures
+import functools
 import hashlib
+import mmap
+import operator
 import os
+import sys
+import threading
 import json
+from collections import Counter
 from pathlib import Path
-from typing import Tuple, Dict, List, Any
+from typing import Tuple, Dict, List, Any, Optional, Sequence
+
+try:
+    import numpy as _np
+except ImportError:
+    # numpy is optional: the pure-Python tally covers all batch sizes.
+    _np = None
+
+# Batch size at which the numpy unique/count path beats the dict tally.
+_NUMPY_MIN_BATCH = 64
+
+# Batch size at which chunked thread-pool validation pays for itself.
+_PARALLEL_MIN_BATCH = 256
+
+# C-level extraction of the 'result' field; only applied after the
+# responses have been validated to be dicts containing that key.
+_get_result = operator.itemgetter('result')
+
+# Synthesis packet schema: fixed for the protocol, shared by every
+# enforcer instance so no per-instance (let alone per-call) sets are built.
+_SYNTHESIS_REQUIRED = frozenset(('source', 'action', 'data'))
+_SYNTHESIS_EXPECTED = frozenset(
+    ('source', 'action', 'data', 'timestamp', 'metadata', 'consensus')
+)
+
+# Parsed allowlists keyed by absolute path, guarded by a
+# (st_mtime_ns, st_size) signature: re-constructing an enforcer against
+# an unchanged file costs one stat instead of a read, decode and parse.
+_ALLOWLIST_CACHE: Dict[str, Tuple[Tuple[int, int], frozenset]] = {}
+_allowlist_cache_lock = threading.Lock()
+
+
+def _validate_chunk(span: Tuple[int, list]) -> Optional[str]:
+    """
+    Validate one slice of a responses list.
+
+    Args:
+        span (tuple): (offset, chunk) where offset is the slice's index
+                      into the full list, used for error messages.
+
+    Returns:
+        str or None: Error message for the first invalid entry, or None.
+    """
+    offset, chunk = span
+
+    # Fused single sweep for the common all-valid case; the enumerate
+    # bookkeeping to locate the offending index only runs on failure.
+    # Exact-type check: responses are plain dicts in this API, and
+    # type-is skips the MRO walk isinstance pays per element.
+    if all(type(resp) is dict and 'result' in resp for resp in chunk):
+        return None
+
+    for i, resp in enumerate(chunk):
+        if type(resp) is not dict:
+            return f'All responses must be dictionaries (response {offset + i} is not)'
+        if 'result' not in resp:
+            return f'Response {offset + i} missing "result" field'
+    return None
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Canonicalize a result value into a hashable cache key.
+
+    Hashable values pass through unchanged; unhashable ones are
+    serialized deterministically so equal payloads share a key.
+    """
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        try:
+            return json.dumps(value, sort_keys=True)
+        except (TypeError, ValueError):
+            return repr(value)
+
+
+# Prebuilt verdicts for the overwhelmingly common success outcomes, so
+# hot paths return pooled tuples instead of formatting a fresh message
+# per call. Descriptive counts are formatted only under PROTOS_VERBOSE=1;
+# denial verdicts always carry full diagnostics since they are rare and
+# need them. The per-source hash suffix additionally requires hash
+# logging to be on.
+_VERBOSE = os.getenv('PROTOS_VERBOSE', '0') == '1'
+_SANCTUARY_OK = (True, 'Sanctuary access granted')
+_SANCTUARY_DENIED = (False, 'Sanctuary access denied: source not in allowlist')
+_SYNTHESIS_OK = (True, 'Synthesis check passed: packet validated')
+_LOGIC_OK = (True, 'Logic consensus reached')
+
+
+@functools.lru_cache(maxsize=256)
+def _sanctuary_verdict(source_id: str, allowlist: frozenset) -> Tuple[bool, str]:
+    """
+    Memoized sanctuary verdict for a source against a given allowlist.
+
+    Keyed on the allowlist object itself, so a reloaded allowlist starts
+    fresh entries automatically. The small maxsize bounds cache growth
+    when callers present high-cardinality source IDs.
+    """
+    if source_id in allowlist:
+        return _SANCTUARY_OK
+    return _SANCTUARY_DENIED
+
+
+def _consensus_verdict(best_count: int, total: int,
+                       threshold: float) -> Tuple[bool, str]:
+    """
+    Build the logic verdict from a completed majority tally.
+
+    Args:
+        best_count (int): Size of the largest agreeing group.
+        total (int): Total number of responses.
+        threshold (float): Consensus ratio threshold 0.0-1.0.
+
+    Returns:
+        tuple: (consensus_reached, message)
+    """
+    consensus_ratio = best_count / total
+
+    if consensus_ratio >= threshold:
+        if _VERBOSE:
+            return True, f'Logic consensus reached: {best_count}/{total} responses agree'
+        return _LOGIC_OK
+
+    return False, (f'Logic consensus not reached: {best_count}/{total} agreement '
+                   f'({consensus_ratio:.2%}) below threshold ({threshold:.2%})')
 
 
 class Protos1Enforcer:
@@ -27,7 +159,8 @@ class Protos1Enforcer:
     On any error, enforcement denies access (fail-closed).
     """
     
-    def __init__(self, base_dir: str = None, allowlist_path: str = None, 
+    def __init__(self, base_dir: Optional[str] = None,
+                 allowlist_path: Optional[str] = None,
                  consensus_threshold: float = 0.66):
         """
         Initialize the PROTOS-1 enforcer.
@@ -59,46 +192,188 @@ class Protos1Enforcer:
         
         if not (0.0 <= self.consensus_threshold <= 1.0):
             raise ValueError('consensus_threshold must be between 0.0 and 1.0')
-        
-        self._allowlist_cache = None
-    
-    def _get_allowlist(self) -> set:
+
+        if not os.path.isdir(self.base_dir):
+            raise ValueError(f'base_dir does not exist: {self.base_dir}')
+
+        # Resolve the allowlist location once, up front. Comparing
+        # resolved path components (rather than a string prefix) means
+        # symlinks are followed and sibling directories with a shared
+        # name prefix cannot slip past the check.
+        base = Path(self.base_dir).resolve()
+        resolved = (base / self.allowlist_path).resolve()
+
+        # Prevent path traversal: ensure path is within base_dir
+        if base != resolved and base not in resolved.parents:
+            raise ValueError('Allowlist path escapes base directory')
+
+        # Resolved exactly once here; every later load (including
+        # reset_cache) reuses the prebuilt string, so no enforcement
+        # call ever pays for Path arithmetic or re-resolution.
+        full_path = str(resolved)
+        self._resolved_allowlist_path: str = full_path
+
+        # Hashing source IDs for log messages is pure overhead on the hot
+        # path; opt in via environment when the hashed IDs are needed.
+        self._log_hash = os.getenv('PROTOS_LOG_HASH', '0') == '1'
+
+        # Eagerly materialize the allowlist as an immutable frozenset. A
+        # missing or unreadable file fails closed: the empty allowlist
+        # denies every source.
+        try:
+            self._allowlist: frozenset = self._load_allowlist(full_path)
+        except OSError:
+            self._allowlist = frozenset()
+
+        # Optional timing-hardened membership: compare fixed-length
+        # blake2b digests so the lookup does identical work on hit and
+        # miss, regardless of source string length.
+        self._timing_hardened = os.getenv('PROTOS_TIMING_HARDENED', '0') == '1'
+        self._allowlist_digests = self._digest_allowlist() if self._timing_hardened else None
+
+        # Optional chunked validation of very large response lists. The
+        # pool is created lazily so single-node deployments never pay
+        # its construction cost; the lock guards creation on the shared
+        # gateway singleton, where a racing pair of large calls would
+        # otherwise each build a pool and leak the loser's workers.
+        self._parallel_logic = os.getenv('PROTOS_PARALLEL_LOGIC', '0') == '1'
+        self._validate_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._validate_pool_lock = threading.Lock()
+
+        # The synthesis schema is fixed, so precompile a specialized
+        # validator instead of rebuilding field sets per call.
+        self._validate_packet = self._build_packet_validator()
+
+        # Integration paths revalidate near-identical packets (same
+        # source/action/shape, different payload values), so remember the
+        # last structural fingerprint and its verdict. Held as a single
+        # (fingerprint, verdict) tuple so the pair is read and published
+        # atomically under the GIL; the instance is shared across threads
+        # via the gateway singleton.
+        self._last_synthesis: Optional[Tuple[Any, Tuple[bool, str]]] = None
+
+        # Static portion of get_status(), built lazily and invalidated
+        # by reset_cache(); the volatile cache statistics are layered on
+        # top per call.
+        self._status_cache: Optional[Dict[str, Any]] = None
+
+    def _build_packet_validator(self):
         """
-        Load and cache the sanctuary allowlist.
-        
+        Build a schema-specialized packet validator closure.
+
+        The allowed-field set is bound as a default argument so the hot
+        path runs straight-line checks with local loads only.
+
         Returns:
-            set: Set of authorized source identifiers.
-        
-        Raises:
-            IOError: If allowlist cannot be read.
+            callable: validator(packet) -> (valid: bool, message: str)
         """
-        if self._allowlist_cache is not None:
-            return self._allowlist_cache
-        
-        try:
-            full_path = os.path.join(self.base_dir, self.allowlist_path)
-            full_path = os.path.abspath(full_path)
-            
-            # Prevent path traversal: ensure path is within base_dir
-            base_abs = os.path.abspath(self.base_dir)
-            if not full_path.startswith(base_abs):
-                raise ValueError('Allowlist path escapes base directory')
-            
-            with open(full_path, 'r') as f:
-                lines = f.readlines()
-            
-            allowlist = set()
-            for line in lines:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    allowlist.add(line)
-            
-            self._allowlist_cache = allowlist
-            return allowlist
-        
-        except Exception as e:
-            raise IOError(f'Failed to load allowlist: {str(e)}')
+        def _validate_packet(packet, _required=_SYNTHESIS_REQUIRED,
+                             _allowed=_SYNTHESIS_EXPECTED):
+            # Exact-type check: a single pointer compare instead of the
+            # MRO walk isinstance can take. Packets cross a trust
+            # boundary, so dict subclasses (which can override
+            # __getitem__/keys) are rejected rather than validated.
+            if type(packet) is not dict:
+                return False, 'Packet must be a dictionary'
+
+            # One C-level superset test covers presence of all required
+            # fields; the difference set is only built for the message.
+            if not _required <= packet.keys():
+                missing = sorted(_required - packet.keys())
+                return False, f'Missing required fields: {missing}'
+
+            # One fused lookup+check per field, cheapest rejection first:
+            # falsy (empty) before the isinstance call.
+            if not ((source := packet['source']) and isinstance(source, str)):
+                return False, 'Field "source" must be a non-empty string'
+
+            if not ((action := packet['action']) and isinstance(action, str)):
+                return False, 'Field "action" must be a non-empty string'
+
+            data = packet['data']
+            if data is not None and not isinstance(data, dict):
+                return False, 'Field "data" must be a dictionary or None'
+
+            for key in packet:
+                if key not in _allowed:
+                    return False, f'Unexpected field: {key}'
+
+            return _SYNTHESIS_OK
+
+        return _validate_packet
+
+    def _load_allowlist(self, full_path: str) -> frozenset:
+        """
+        Parse the allowlist file into a frozenset of source identifiers.
+
+        Results are cached at module scope keyed on path and stat
+        signature, so repeated enforcer constructions against the same
+        unchanged file short-circuit the read and parse.
+
+        The file is memory-mapped and consumed line by line, so very
+        large allowlists stream through the page cache without ever
+        materializing a full bytes copy of the file; comment and blank
+        lines are filtered with C-level byte operations and only the
+        surviving identifiers are decoded to str. Files that cannot be
+        mapped (empty files, non-regular files) fall back to a single
+        buffered read.
+
+        Entries are interned so membership probes against sources that
+        were themselves interned (e.g. by the gateway) short-circuit on
+        pointer identity instead of a character compare. The allowlist is
+        operator-curated and bounded, so intern table growth is bounded
+        with it.
+
+        Args:
+            full_path (str): Absolute path to the allowlist file.
+
+        Returns:
+            frozenset: Authorized source identifiers.
+        """
+        st = os.stat(full_path)
+        sig = (st.st_mtime_ns, st.st_size)
+
+        with _allowlist_cache_lock:
+            cached = _ALLOWLIST_CACHE.get(full_path)
+            if cached is not None and cached[0] == sig:
+                return cached[1]
+
+        with open(full_path, 'rb') as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    allowlist = frozenset(
+                        sys.intern(line.decode('utf-8', 'replace'))
+                        for line in (raw.strip()
+                                     for raw in iter(mm.readline, b''))
+                        if line and not line.startswith(b'#')
+                    )
+            except (ValueError, OSError):
+                # mmap rejects empty and non-regular files; fall back to
+                # an ordinary slurp-and-split.
+                f.seek(0)
+                data = f.read()
+                allowlist = frozenset(
+                    sys.intern(line.decode('utf-8', 'replace'))
+                    for line in (raw.strip() for raw in data.splitlines())
+                    if line and not line.startswith(b'#')
+                )
+
+        with _allowlist_cache_lock:
+            _ALLOWLIST_CACHE[full_path] = (sig, allowlist)
+        return allowlist
     
+    def _digest_allowlist(self) -> frozenset:
+        """
+        Precompute fixed-length blake2b digests of the allowlist entries.
+
+        Returns:
+            frozenset: 16-byte digests, one per authorized source.
+        """
+        return frozenset(
+            hashlib.blake2b(entry.encode(), digest_size=16).digest()
+            for entry in self._allowlist
+        )
+
     def _hash_source(self, source_id: str) -> str:
         """
         Hash a source identifier (for secure logging).
@@ -115,8 +390,11 @@ class Protos1Enforcer:
     def enforce_sanctuary(self, source_id: str) -> Tuple[bool, str]:
         """
         Sanctuary Directive: Validate source authorization.
-        
+
         Checks if the source identifier is in the authorized allowlist.
+        The allowlist is held as an immutable frozenset, so the check is
+        a single O(1) hash lookup and safe to share across threads
+        without locking.
         Fails closed: denies access on any error or if source not found.
         
         Args:
@@ -129,19 +407,30 @@ class Protos1Enforcer:
         """
         try:
             if not isinstance(source_id, str) or not source_id:
-                return False, 'Source ID must be a non-empty string'
-            
-            allowlist = self._get_allowlist()
-            
-            if source_id in allowlist:
+                return False, 'Invalid source ID: must be a non-empty string'
+
+            if self._timing_hardened:
+                key = hashlib.blake2b(source_id.encode(), digest_size=16).digest()
+                allowed = key in self._allowlist_digests
+            elif not self._log_hash:
+                # Common path: repeated sources resolve from the LRU.
+                return _sanctuary_verdict(source_id, self._allowlist)
+            else:
+                allowed = source_id in self._allowlist
+
+            if allowed:
+                if self._log_hash:
+                    hashed = self._hash_source(source_id)
+                    return True, f'Sanctuary access granted to source {hashed}'
+                return _SANCTUARY_OK
+
+            if self._log_hash:
                 hashed = self._hash_source(source_id)
-                return True, f'Sanctuary check passed for source {hashed}'
-            
-            hashed = self._hash_source(source_id)
-            return False, f'Source {hashed} not in allowlist'
-        
+                return False, f'Sanctuary access denied: source {hashed} not in allowlist'
+            return _SANCTUARY_DENIED
+
         except Exception as e:
-            return False, f'Sanctuary check failed: {str(e)}'
+            return False, f'Sanctuary check failed: {e}'
     
     def enforce_synthesis(self, packet: Dict[str, Any]) -> Tuple[bool, str]:
         """
@@ -165,88 +454,239 @@ class Protos1Enforcer:
                 - message (str): Descriptive message
         """
         try:
-            if not isinstance(packet, dict):
-                return False, 'Packet must be a dictionary'
-            
-            # Check required fields
-            required_fields = {'source', 'action', 'data'}
-            if not required_fields.issubset(packet.keys()):
-                missing = required_fields - packet.keys()
-                return False, f'Missing required fields: {missing}'
-            
-            # Validate 'source' and 'action' are non-empty strings
-            if not isinstance(packet['source'], str) or not packet['source']:
-                return False, 'Field "source" must be a non-empty string'
-            
-            if not isinstance(packet['action'], str) or not packet['action']:
-                return False, 'Field "action" must be a non-empty string'
-            
-            # Validate 'data' is dict or None
-            if packet['data'] is not None and not isinstance(packet['data'], dict):
-                return False, 'Field "data" must be a dictionary or None'
-            
-            # Check for unexpected fields
-            expected_fields = {'source', 'action', 'data', 'timestamp', 'metadata'}
-            unexpected = set(packet.keys()) - expected_fields
-            if unexpected:
-                return False, f'Unexpected fields: {unexpected}'
-            
-            return True, 'Synthesis check passed'
-        
+            # Fast path: a packet with the same structural fingerprint as
+            # the previous one gets the cached verdict. The fingerprint
+            # covers the full key set and the payload type (not value), and
+            # only exact str source/action qualify. The payload is keyed
+            # on the type object itself — type names are not unique, so a
+            # foreign class named 'dict' must not collide with the real
+            # one and inherit its cached verdict.
+            if type(packet) is dict:
+                source = packet.get('source')
+                action = packet.get('action')
+                if type(source) is str and type(action) is str:
+                    fp = (source, action,
+                          type(packet.get('data')),
+                          frozenset(packet))
+                    # Single read into a local: the pair can be swapped
+                    # by another thread between the compare and the use.
+                    cached = self._last_synthesis
+                    if cached is not None and cached[0] == fp:
+                        return cached[1]
+
+                    verdict = self._validate_packet(packet)
+                    # One store publishes fingerprint and verdict
+                    # together, so a concurrent writer can never pair
+                    # one packet's fingerprint with another's verdict.
+                    self._last_synthesis = (fp, verdict)
+                    return verdict
+
+            return self._validate_packet(packet)
+
         except Exception as e:
-            return False, f'Synthesis check failed: {str(e)}'
+            return False, f'Synthesis check failed: {e}'
     
-    def enforce_logic(self, responses: List[Dict[str, Any]]) -> Tuple[bool, str]:
+    def enforce_logic(self, responses: Optional[List[Dict[str, Any]]] = None, *,
+                      results: Optional[Sequence[Any]] = None) -> Tuple[bool, str]:
         """
         Logic Directive: Consensus reconciliation across responses.
-        
-        Determines consensus by checking for 'result' field in responses:
-        - Counts responses with 'result' == 'approve'
-        - Calculates ratio of approvals / total responses
+
+        Determines consensus by majority vote over the 'result' field:
+        - Tallies how many responses share the most common result
+        - Calculates ratio of agreeing responses / total responses
         - Passes if ratio >= consensus_threshold
-        
+
         Fails closed: denies if responses empty, invalid, or consensus not reached.
-        
+
         Args:
             responses (list): List of response dictionaries, each with 'result' field.
-        
+            results (sequence): Alternative flat sequence of result values;
+                                when given, the per-response dict unpacking
+                                is skipped entirely.
+
         Returns:
             tuple: (consensus_reached, message)
                 - consensus_reached (bool): True if consensus threshold met, False otherwise
                 - message (str): Descriptive message with consensus details
         """
         try:
+            if results is not None:
+                if not isinstance(results, (list, tuple)):
+                    return False, 'Results must be a list or tuple'
+
+                total = len(results)
+                if total == 0:
+                    return False, 'No responses provided'
+                if total == 1:
+                    return True, 'Single response, consensus trivially reached'
+
+                try:
+                    values = tuple(results)
+                    hash(values)
+                except TypeError:
+                    values = tuple(_freeze(v) for v in results)
+
+                return self._consensus_cached(values, self.consensus_threshold)
+
             if not isinstance(responses, list):
                 return False, 'Responses must be a list'
-            
-            if len(responses) == 0:
-                return False, 'Responses list cannot be empty'
-            
+
+            total = len(responses)
+            if total == 0:
+                return False, 'No responses provided'
+
             # Validate each response
-            approvals = 0
-            for i, resp in enumerate(responses):
-                if not isinstance(resp, dict):
-                    return False, f'Response {i} is not a dictionary'
-                
-                if 'result' not in resp:
-                    return False, f'Response {i} missing "result" field'
-                
-                if resp['result'] == 'approve':
-                    approvals += 1
-            
-            consensus_ratio = approvals / len(responses)
-            
-            if consensus_ratio >= self.consensus_threshold:
-                return True, f'Logic consensus passed: {approvals}/{len(responses)} approvals'
-            
-            return False, (f'Logic consensus failed: {approvals}/{len(responses)} approvals '
-                          f'({consensus_ratio:.2%}) below threshold ({self.consensus_threshold:.2%})')
-        
+            if self._parallel_logic and total >= _PARALLEL_MIN_BATCH:
+                error = self._validate_responses_parallel(responses)
+            else:
+                error = _validate_chunk((0, responses))
+            if error is not None:
+                return False, error
+
+            if total == 1:
+                return True, 'Single response, consensus trivially reached'
+
+            # Retries and re-validation replay identical response sets, so
+            # memoize the tally on the canonical value tuple. The common
+            # all-hashable case goes straight to the cache, whose own key
+            # hashing doubles as the hashability probe; only unhashable
+            # results pay for _freeze serialization.
+            try:
+                return self._consensus_cached(
+                    tuple(map(_get_result, responses)),
+                    self.consensus_threshold,
+                )
+            except TypeError:
+                values = tuple(map(_freeze, map(_get_result, responses)))
+                return self._consensus_cached(values, self.consensus_threshold)
+
         except Exception as e:
-            return False, f'Logic check failed: {str(e)}'
-    
-    def reset_cache(self):
+            return False, f'Logic check failed: {e}'
+
+    def _validate_responses_parallel(self, responses: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        Chunk-validate a large response list across a shared thread pool.
+
+        Args:
+            responses (list): Response dictionaries to validate.
+
+        Returns:
+            str or None: First validation error found, or None if all valid.
+        """
+        # Double-checked creation: the steady-state read is lock-free,
+        # and the lock ensures exactly one pool is ever constructed.
+        pool = self._validate_pool
+        if pool is None:
+            with self._validate_pool_lock:
+                pool = self._validate_pool
+                if pool is None:
+                    pool = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=os.cpu_count() or 1
+                    )
+                    self._validate_pool = pool
+
+        total = len(responses)
+        workers = os.cpu_count() or 1
+        chunk_size = -(-total // workers)  # ceiling division
+        spans = [
+            (start, responses[start:start + chunk_size])
+            for start in range(0, total, chunk_size)
+        ]
+
+        for error in pool.map(_validate_chunk, spans):
+            if error is not None:
+                return error
+        return None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _consensus_cached(values: Tuple[Any, ...],
+                          threshold: float) -> Tuple[bool, str]:
         """
-        Reset the allowlist cache (useful for testing after config changes).
+        Memoized majority tally over a canonical tuple of result values.
+
+        Args:
+            values (tuple): Hashable result values, one per response.
+            threshold (float): Consensus ratio threshold 0.0-1.0.
+
+        Returns:
+            tuple: (consensus_reached, message)
         """
-        self._allowlist_cache = None
\ No newline at end of file
+        total = len(values)
+
+        # Quorum bail-out: in the typical skewed vote the first response
+        # already belongs to the majority group, so one C-level count of
+        # that value settles consensus without building the full tally.
+        # Only taken for an absolute majority, which is guaranteed to be
+        # the largest group, keeping the reported count exact.
+        first_count = values.count(values[0])
+        if first_count * 2 > total and first_count / total >= threshold:
+            return _consensus_verdict(first_count, total, threshold)
+
+        # Wide fan-out batches: count in C via numpy's unique. Falls
+        # through when numpy is absent or the values cannot be ordered.
+        if _np is not None and total >= _NUMPY_MIN_BATCH:
+            try:
+                counts = _np.unique(
+                    _np.fromiter(values, dtype=object, count=total),
+                    return_counts=True,
+                )[1]
+            except TypeError:
+                pass
+            else:
+                return _consensus_verdict(int(counts.max()), total, threshold)
+
+        # Counter counts in C (_collections._count_elements); only the
+        # top count is needed, so take max over the tallies rather than
+        # most_common(1), which heap-sorts the full distribution.
+        return _consensus_verdict(max(Counter(values).values()), total, threshold)
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get current enforcer configuration status.
+
+        Read-only: calling this never mutates enforcer state. The
+        configuration portion is immutable between reset_cache() calls,
+        so it is built once and reused; only the volatile consensus
+        cache statistics are re-read per call. A fresh dict is returned
+        each time so callers cannot mutate the cached copy.
+
+        Returns:
+            dict: Configuration details and consensus-cache statistics
+                  (no sensitive data).
+        """
+        if self._status_cache is None:
+            self._status_cache = {
+                'allowlist_path': self.allowlist_path,
+                'allowlist_size': len(self._allowlist),
+                'consensus_threshold': self.consensus_threshold,
+            }
+        cache_info = self._consensus_cached.cache_info()
+        status = dict(self._status_cache)
+        status['consensus_cache'] = {
+            'hits': cache_info.hits,
+            'misses': cache_info.misses,
+            'size': cache_info.currsize,
+        }
+        return status
+
+    def reset_cache(self) -> None:
+        """
+        Reload the allowlist and clear the consensus cache (useful for
+        testing after config changes).
+        """
+        try:
+            self._allowlist = self._load_allowlist(self._resolved_allowlist_path)
+        except OSError:
+            self._allowlist = frozenset()
+        if self._timing_hardened:
+            self._allowlist_digests = self._digest_allowlist()
+        _sanctuary_verdict.cache_clear()
+        self._consensus_cached.cache_clear()
+        self._status_cache = None
+        # Retire the validation pool so its worker threads do not
+        # outlive a reset; the next large batch rebuilds it lazily.
+        with self._validate_pool_lock:
+            pool, self._validate_pool = self._validate_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
\ No newline at end of file
@@ -12,8 +12,10 @@ SECURITY:
 """
 
 import os
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple, Dict, Any, List, Optional
+from typing import Tuple, Dict, Any, Callable, List, Optional
 
 from protos.protos1_enforcer import Protos1Enforcer
 
@@ -21,6 +23,77 @@ from protos.protos1_enforcer import Protos1Enforcer
 # Module-level enforcer instance (lazy-initialized)
 _enforcer_instance: Optional[Protos1Enforcer] = None
 
+# Guards construction and reset of the singleton. The initialized fast
+# path stays lock-free: it only reads the published instance.
+_enforcer_lock = threading.Lock()
+
+# Bound enforcement methods of the published instance, resolved once
+# after construction so the per-call path skips the getattr lookup.
+# Cleared together with the instance on reset.
+_bound_methods: Dict[str, Callable[..., Tuple[bool, str]]] = {}
+
+@lru_cache(maxsize=1)
+def _default_base_dir() -> str:
+    """
+    Resolve the project root (parent of the protos/ directory) once.
+
+    Pure and idempotent, so the lru_cache not-call-once caveat under
+    concurrency is harmless: a race costs at most one duplicate string.
+    """
+    return str(Path(__file__).resolve().parent.parent)
+
+
+# Parsed (base_dir, allowlist_path, consensus_threshold) tuple, memoized
+# between resets so repeated cold paths skip env reads and float parsing.
+_CONFIG_CACHE: Optional[Tuple[str, str, float]] = None
+
+
+def _load_config() -> Tuple[str, str, float]:
+    """
+    Read and validate gateway configuration from the environment.
+
+    The parsed tuple is cached until reset_enforcer() clears it, so test
+    suites that reset between cases do not re-pay env lookups, Path
+    construction and threshold parsing on every re-initialization.
+
+    Returns:
+        Tuple of (base_dir, allowlist_path, consensus_threshold)
+
+    Raises:
+        RuntimeError: If PROTOS_CONSENSUS_THRESHOLD is invalid
+    """
+    global _CONFIG_CACHE
+
+    if _CONFIG_CACHE is not None:
+        return _CONFIG_CACHE
+
+    base_dir = os.environ.get('PROTOS_BASE_DIR') or _default_base_dir()
+
+    allowlist_path = os.environ.get('PROTOS_ALLOWLIST_PATH', 'config/sanctuary.conf')
+
+    # Parse consensus threshold with validation. The cheap string
+    # prefilter keeps exception construction off the configuration path
+    # for ordinary bad input; isdecimal (not isdigit, which also admits
+    # superscripts and other digit characters float() rejects) accepts
+    # exactly the plain decimal forms a threshold should take. The
+    # except clause is a backstop that preserves the RuntimeError
+    # contract even for input the prefilter misjudges.
+    threshold_str = os.environ.get('PROTOS_CONSENSUS_THRESHOLD', '0.66')
+    stripped = threshold_str.strip()
+    if not stripped or not stripped.replace('.', '', 1).isdecimal():
+        raise RuntimeError(f"Invalid PROTOS_CONSENSUS_THRESHOLD: {threshold_str}")
+    try:
+        consensus_threshold = float(stripped)
+    except ValueError:
+        raise RuntimeError(f"Invalid PROTOS_CONSENSUS_THRESHOLD: {threshold_str}")
+
+    # Validate threshold range
+    if not 0.0 <= consensus_threshold <= 1.0:
+        raise RuntimeError(f"PROTOS_CONSENSUS_THRESHOLD must be 0.0-1.0, got {consensus_threshold}")
+
+    _CONFIG_CACHE = (base_dir, allowlist_path, consensus_threshold)
+    return _CONFIG_CACHE
+
 
 def _get_enforcer() -> Protos1Enforcer:
     """
@@ -38,39 +111,69 @@ def _get_enforcer() -> Protos1Enforcer:
         RuntimeError: If configuration is invalid
     """
     global _enforcer_instance
-    
+
+    # Fast path: already published, no lock needed.
     if _enforcer_instance is not None:
         return _enforcer_instance
-    
-    # Read configuration from environment with safe defaults
-    base_dir = os.environ.get('PROTOS_BASE_DIR')
-    if not base_dir:
-        # Default to project root (parent of protos/ directory)
-        base_dir = str(Path(__file__).parent.parent)
-    
-    allowlist_path = os.environ.get('PROTOS_ALLOWLIST_PATH', 'config/sanctuary.conf')
-    
-    # Parse consensus threshold with validation
-    threshold_str = os.environ.get('PROTOS_CONSENSUS_THRESHOLD', '0.66')
-    try:
-        consensus_threshold = float(threshold_str)
-    except ValueError:
-        raise RuntimeError(f"Invalid PROTOS_CONSENSUS_THRESHOLD: {threshold_str}")
-    
-    # Validate threshold range
-    if not 0.0 <= consensus_threshold <= 1.0:
-        raise RuntimeError(f"PROTOS_CONSENSUS_THRESHOLD must be 0.0-1.0, got {consensus_threshold}")
-    
-    # Initialize enforcer
-    try:
-        _enforcer_instance = Protos1Enforcer(
-            base_dir=base_dir,
-            allowlist_path=allowlist_path,
-            consensus_threshold=consensus_threshold
+
+    with _enforcer_lock:
+        # Re-check under the lock: another thread may have won the race
+        # and published while we waited.
+        if _enforcer_instance is not None:
+            return _enforcer_instance
+
+        # Read configuration from environment with safe defaults
+        base_dir, allowlist_path, consensus_threshold = _load_config()
+
+        # Initialize enforcer; publish only after successful construction
+        # so partially initialized state is never visible.
+        try:
+            enforcer = Protos1Enforcer(
+                base_dir=base_dir,
+                allowlist_path=allowlist_path,
+                consensus_threshold=consensus_threshold
+            )
+        except Exception as e:
+            raise RuntimeError(f"Failed to initialize PROTOS-1 enforcer: {e}")
+
+        # Bind the enforcement methods once, before publishing, so any
+        # thread that can see the instance can also see its methods.
+        _bound_methods.update(
+            enforce_sanctuary=enforcer.enforce_sanctuary,
+            enforce_synthesis=enforcer.enforce_synthesis,
+            enforce_logic=enforcer.enforce_logic,
         )
-        return _enforcer_instance
+        _enforcer_instance = enforcer
+        return enforcer
+
+
+def _safe_call(label: str, method_name: str, *args: Any,
+               **kwargs: Any) -> Tuple[bool, str]:
+    """
+    Invoke an enforcer method behind the shared fail-closed wrapper.
+
+    Enforcer initialization happens inside the try block, so
+    configuration errors also fail closed rather than propagate. The
+    bound method is looked up in _bound_methods, a dict populated once
+    at construction, so the steady-state path pays one dict hit instead
+    of a getattr per call.
+
+    Args:
+        label: Directive name used in the failure message
+        method_name: Name of the Protos1Enforcer method to invoke
+
+    Returns:
+        The enforcement verdict, or (False, message) on any error
+    """
+    try:
+        fn = _bound_methods.get(method_name)
+        if fn is None:
+            _get_enforcer()
+            fn = _bound_methods[method_name]
+        return fn(*args, **kwargs)
     except Exception as e:
-        raise RuntimeError(f"Failed to initialize PROTOS-1 enforcer: {e}")
+        # Fail closed on any error
+        return False, f"{label} check failed: {e}"
 
 
 def enforce_sanctuary(source_identifier: str) -> Tuple[bool, str]:
@@ -94,12 +197,12 @@ def enforce_sanctuary(source_identifier: str) -> Tuple[bool, str]:
         if not allowed:
             return error_response(msg)
     """
-    try:
-        enforcer = _get_enforcer()
-        return enforcer.enforce_sanctuary(source_identifier)
-    except Exception as e:
-        # Fail closed on any error
-        return False, f"Sanctuary check failed: {str(e)}"
+    # Deliberately no sys.intern here: this entry point receives
+    # arbitrary, possibly attacker-influenced identifiers, and interned
+    # strings are pinned for process life — interning them would grow
+    # the intern table without bound. Allowlist entries are interned at
+    # load time instead, which is where the vocabulary is bounded.
+    return _safe_call("Sanctuary", 'enforce_sanctuary', source_identifier)
 
 
 def enforce_synthesis(packet: Dict[str, Any]) -> Tuple[bool, str]:
@@ -131,25 +234,24 @@ def enforce_synthesis(packet: Dict[str, Any]) -> Tuple[bool, str]:
         if not valid:
             return error_response(msg)
     """
-    try:
-        enforcer = _get_enforcer()
-        return enforcer.enforce_synthesis(packet)
-    except Exception as e:
-        # Fail closed on any error
-        return False, f"Synthesis check failed: {str(e)}"
+    return _safe_call("Synthesis", 'enforce_synthesis', packet)
 
 
-def enforce_logic(responses: List[Dict[str, Any]]) -> Tuple[bool, str]:
+def enforce_logic(responses: Optional[List[Dict[str, Any]]] = None, *,
+                  results: Optional[List[Any]] = None) -> Tuple[bool, str]:
     """
     GATEWAY FUNCTION: Logic Enforcement
-    
+
     Reconciles multiple node/agent responses using consensus voting.
     Use this when you have multiple responses that need agreement validation.
-    
+
     Args:
         responses: List of response dictionaries from different nodes/agents
                   Each should contain a 'result' field or be comparable
-    
+        results: Alternative flat list of result values; use this when the
+                 responses carry nothing but the result to skip the
+                 per-response dict unpacking
+
     Returns:
         Tuple of (consensus_reached, message)
         - consensus_reached: True if consensus threshold met
@@ -165,12 +267,7 @@ def enforce_logic(responses: List[Dict[str, Any]]) -> Tuple[bool, str]:
         if not consensus:
             return error_response(msg)
     """
-    try:
-        enforcer = _get_enforcer()
-        return enforcer.enforce_logic(responses)
-    except Exception as e:
-        # Fail closed on any error
-        return False, f"Logic check failed: {str(e)}"
+    return _safe_call("Logic", 'enforce_logic', responses, results=results)
 
 
 def get_enforcer_status() -> Dict[str, Any]:
@@ -201,5 +298,8 @@ def reset_enforcer():
     WARNING: This will cause the next enforcement call to re-read configuration.
     Use with caution in production environments.
     """
-    global _enforcer_instance
-    _enforcer_instance = None
+    global _enforcer_instance, _CONFIG_CACHE
+    with _enforcer_lock:
+        _enforcer_instance = None
+        _CONFIG_CACHE = None
+        _bound_methods.clear()
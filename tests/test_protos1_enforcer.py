@@ -26,26 +26,34 @@ from protos.protos1_enforcer import Protos1Enforcer
 class TestProtos1Enforcer(unittest.TestCase):
     """Test suite for Protos1Enforcer core functionality."""
     
-    def setUp(self):
-        """Set up test fixtures before each test."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared, read-only test fixtures once for the suite."""
         # Create temporary directory for test files
-        self.test_dir = tempfile.mkdtemp()
-        self.allowlist_path = os.path.join(self.test_dir, 'test_allowlist.conf')
-        
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.test_dir = cls._tmp.name
+        cls.allowlist_path = os.path.join(cls.test_dir, 'test_allowlist.conf')
+
         # Create test allowlist
-        with open(self.allowlist_path, 'w') as f:
+        with open(cls.allowlist_path, 'w') as f:
             f.write("# Test allowlist\n")
             f.write("node-alpha\n")
             f.write("node-beta\n")
             f.write("test-agent\n")
-    
-    def tearDown(self):
-        """Clean up test fixtures after each test."""
-        # Remove test files
-        if os.path.exists(self.allowlist_path):
-            os.remove(self.allowlist_path)
-        if os.path.exists(self.test_dir):
-            os.rmdir(self.test_dir)
+
+        # Shared enforcer (default 0.66 threshold) for tests that don't
+        # mutate configuration; tests needing distinct config construct
+        # their own.
+        cls.enforcer = Protos1Enforcer(
+            base_dir=cls.test_dir,
+            allowlist_path='test_allowlist.conf',
+            consensus_threshold=0.66
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up shared test fixtures after the suite."""
+        cls._tmp.cleanup()
     
     def test_enforcer_initialization(self):
         """Test enforcer initializes correctly with valid config."""
@@ -88,10 +96,7 @@ class TestProtos1Enforcer(unittest.TestCase):
     
     def test_sanctuary_allowed_source(self):
         """Test sanctuary allows sources in allowlist."""
-        enforcer = Protos1Enforcer(
-            base_dir=self.test_dir,
-            allowlist_path='test_allowlist.conf'
-        )
+        enforcer = self.enforcer
         
         allowed, msg = enforcer.enforce_sanctuary('node-alpha')
         self.assertTrue(allowed)
@@ -99,10 +104,7 @@ class TestProtos1Enforcer(unittest.TestCase):
     
     def test_sanctuary_denied_source(self):
         """Test sanctuary denies sources not in allowlist."""
-        enforcer = Protos1Enforcer(
-            base_dir=self.test_dir,
-            allowlist_path='test_allowlist.conf'
-        )
+        enforcer = self.enforcer
         
         allowed, msg = enforcer.enforce_sanctuary('unknown-node')
         self.assertFalse(allowed)
@@ -110,10 +112,7 @@ class TestProtos1Enforcer(unittest.TestCase):
     
     def test_sanctuary_empty_source(self):
         """Test sanctuary rejects empty source identifier."""
-        enforcer = Protos1Enforcer(
-            base_dir=self.test_dir,
-            allowlist_path='test_allowlist.conf'
-        )
+        enforcer = self.enforcer
         
         allowed, msg = enforcer.enforce_sanctuary('')
         self.assertFalse(allowed)
@@ -133,10 +132,7 @@ class TestProtos1Enforcer(unittest.TestCase):
     
     def test_synthesis_valid_packet(self):
         """Test synthesis accepts valid packet structure."""
-        enforcer = Protos1Enforcer(
-            base_dir=self.test_dir,
-            allowlist_path='test_allowlist.conf'
-        )
+        enforcer = self.enforcer
         
         packet = {
             'source': 'node-alpha',
@@ -150,10 +146,7 @@ class TestProtos1Enforcer(unittest.TestCase):
     
     def test_synthesis_missing_fields(self):
         """Test synthesis rejects packets with missing required fields."""
-        enforcer = Protos1Enforcer(
-            base_dir=self.test_dir,
-            allowlist_path='test_allowlist.conf'
-        )
+        enforcer = self.enforcer
         
         # Missing 'data' field
         packet = {
@@ -167,10 +160,7 @@ class TestProtos1Enforcer(unittest.TestCase):
     
     def test_synthesis_empty_source(self):
         """Test synthesis rejects packet with empty source."""
-        enforcer = Protos1Enforcer(
-            base_dir=self.test_dir,
-            allowlist_path='test_allowlist.conf'
-        )
+        enforcer = self.enforcer
         
         packet = {
             'source': '',
@@ -184,10 +174,7 @@ class TestProtos1Enforcer(unittest.TestCase):
     
     def test_synthesis_invalid_action(self):
         """Test synthesis rejects packet with invalid action."""
-        enforcer = Protos1Enforcer(
-            base_dir=self.test_dir,
-            allowlist_path='test_allowlist.conf'
-        )
+        enforcer = self.enforcer
         
         packet = {
             'source': 'node-alpha',
@@ -201,10 +188,7 @@ class TestProtos1Enforcer(unittest.TestCase):
     
     def test_synthesis_not_dict(self):
         """Test synthesis rejects non-dictionary packets."""
-        enforcer = Protos1Enforcer(
-            base_dir=self.test_dir,
-            allowlist_path='test_allowlist.conf'
-        )
+        enforcer = self.enforcer
         
         valid, msg = enforcer.enforce_synthesis("not a dict")
         self.assertFalse(valid)
@@ -212,11 +196,7 @@ class TestProtos1Enforcer(unittest.TestCase):
     
     def test_logic_consensus_reached(self):
         """Test logic detects consensus when threshold met."""
-        enforcer = Protos1Enforcer(
-            base_dir=self.test_dir,
-            allowlist_path='test_allowlist.conf',
-            consensus_threshold=0.66
-        )
+        enforcer = self.enforcer
         
         # 3 out of 4 agree (75% > 66%)
         responses = [
@@ -232,11 +212,7 @@ class TestProtos1Enforcer(unittest.TestCase):
     
     def test_logic_no_consensus(self):
         """Test logic detects lack of consensus when threshold not met."""
-        enforcer = Protos1Enforcer(
-            base_dir=self.test_dir,
-            allowlist_path='test_allowlist.conf',
-            consensus_threshold=0.66
-        )
+        enforcer = self.enforcer
         
         # 2 out of 4 agree (50% < 66%)
         responses = [
@@ -252,10 +228,7 @@ class TestProtos1Enforcer(unittest.TestCase):
     
     def test_logic_single_response(self):
         """Test logic handles single response (automatic consensus)."""
-        enforcer = Protos1Enforcer(
-            base_dir=self.test_dir,
-            allowlist_path='test_allowlist.conf'
-        )
+        enforcer = self.enforcer
         
         responses = [{'result': 'approve'}]
         
@@ -265,10 +238,7 @@ class TestProtos1Enforcer(unittest.TestCase):
     
     def test_logic_empty_responses(self):
         """Test logic rejects empty response list."""
-        enforcer = Protos1Enforcer(
-            base_dir=self.test_dir,
-            allowlist_path='test_allowlist.conf'
-        )
+        enforcer = self.enforcer
         
         consensus, msg = enforcer.enforce_logic([])
         self.assertFalse(consensus)
@@ -276,10 +246,7 @@ class TestProtos1Enforcer(unittest.TestCase):
     
     def test_logic_invalid_response_type(self):
         """Test logic rejects non-dictionary responses."""
-        enforcer = Protos1Enforcer(
-            base_dir=self.test_dir,
-            allowlist_path='test_allowlist.conf'
-        )
+        enforcer = self.enforcer
         
         responses = [
             {'result': 'approve'},
@@ -291,6 +258,68 @@ class TestProtos1Enforcer(unittest.TestCase):
         self.assertFalse(consensus)
         self.assertIn('dictionaries', msg.lower())
     
+    def test_logic_results_consensus_reached(self):
+        """Test logic results= path detects consensus when threshold met."""
+        enforcer = self.enforcer
+
+        # 3 out of 4 agree (75% > 66%)
+        results = ['approve', 'approve', 'approve', 'deny']
+
+        consensus, msg = enforcer.enforce_logic(results=results)
+        self.assertTrue(consensus)
+        self.assertIn('consensus reached', msg.lower())
+
+    def test_logic_results_no_consensus(self):
+        """Test logic results= path detects lack of consensus."""
+        enforcer = self.enforcer
+
+        # 2 out of 4 agree (50% < 66%)
+        results = ['approve', 'approve', 'deny', 'deny']
+
+        consensus, msg = enforcer.enforce_logic(results=results)
+        self.assertFalse(consensus)
+        self.assertIn('not reached', msg.lower())
+
+    def test_logic_results_single_value(self):
+        """Test logic results= path handles single value (automatic consensus)."""
+        enforcer = self.enforcer
+
+        consensus, msg = enforcer.enforce_logic(results=['approve'])
+        self.assertTrue(consensus)
+        self.assertIn('single response', msg.lower())
+
+    def test_logic_results_empty(self):
+        """Test logic results= path rejects empty sequence."""
+        enforcer = self.enforcer
+
+        consensus, msg = enforcer.enforce_logic(results=[])
+        self.assertFalse(consensus)
+        self.assertIn('no responses', msg.lower())
+
+    def test_logic_results_invalid_type(self):
+        """Test logic results= path rejects non-list/tuple sequences."""
+        enforcer = self.enforcer
+
+        consensus, msg = enforcer.enforce_logic(results='approve')
+        self.assertFalse(consensus)
+        self.assertIn('list or tuple', msg.lower())
+
+    def test_logic_results_unhashable_values(self):
+        """Test logic results= path handles unhashable result values."""
+        enforcer = self.enforcer
+
+        # Dict results are unhashable; equal payloads must still agree
+        results = [
+            {'verdict': 'approve', 'score': 1},
+            {'verdict': 'approve', 'score': 1},
+            {'verdict': 'approve', 'score': 1},
+            {'verdict': 'deny', 'score': 0}
+        ]
+
+        consensus, msg = enforcer.enforce_logic(results=results)
+        self.assertTrue(consensus)
+        self.assertIn('consensus reached', msg.lower())
+
     def test_logic_different_thresholds(self):
         """Test logic with different consensus thresholds."""
         # Test with 50% threshold